@@ -1,28 +1,87 @@
 """UTILITIES TO HANDLE DATE VALUES"""
 # pylint: disable=too-few-public-methods
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from calendar import isleap
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate, repeat
 
 import re
-from typing import Tuple, Generator, Union
-from dateutil.relativedelta import relativedelta
+from string import ascii_lowercase
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, List, Tuple, Generator, Union
 from exceptions import (
+    CadenceError,
     TimeIntervalError,
     TimeBucketError,
     CadenceTimeBucketError,
     DateValueError,
 )
 
+_ASCII_LETTERS = frozenset(ascii_lowercase)
+_INTERVAL_RE = re.compile(r"(\d+)[_ ]([a-z]+)$")
+_PHRASE_CADENCES = MappingProxyType(
+    {
+        **dict.fromkeys(("yesterday", "last_week", "last_month", "last_year"), 1),
+        **dict.fromkeys(("today", "this_week", "this_month", "this_year"), 0),
+    }
+)
+_ONE_DAY = timedelta(days=1)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _add_months(date_value: datetime, months: int) -> datetime:
+    """Moves a date by a number of months, clamping the day to the end of the month
+
+    Args:
+        date_value (datetime): date to move
+        months (int): number of months to add, negative values move backwards
+    Returns:
+        datetime: the moved date e.g 2023-01-31 + 1 month is 2023-02-28
+    """
+    total = date_value.month - 1 + months
+    year, month = date_value.year + total // 12, total % 12 + 1
+    days_in_month = _DAYS_IN_MONTH[month] + (month == 2 and isleap(year))
+    return date_value.replace(
+        year=year, month=month, day=min(date_value.day, days_in_month)
+    )
+
+
+class _MonthStep:
+    """Month offset added to dates with integer arithmetic, like relativedelta(months=n)"""
+
+    __slots__ = ("months",)
+
+    def __init__(self, months: int):
+        self.months = months
+
+    def __radd__(self, date_value: datetime) -> datetime:
+        return _add_months(date_value, self.months)
+
+
+class _IntervalStep:
+    """Offset that defers to a handler's add_interval, for handlers without get_step"""
+
+    __slots__ = ("handler",)
+
+    def __init__(self, handler: "BaseDateInterval"):
+        self.handler = handler
+
+    def __radd__(self, date_value: datetime) -> datetime:
+        return self.handler.add_interval(
+            date_value=date_value, cadence=self.handler.cadence
+        )
+
 
 class DatePhraseHandler(ABC):
     """Handles Phrases In the Input Date"""
 
-    date_value: Union[str, None] = None
-    time_bucket: Union[str, None] = None
-    cadence: Union[int, None] = None
+    __slots__ = ("date_value", "time_bucket", "cadence")
 
     def __init__(self, date_value: str):
         self.date_value = date_value
+        self.time_bucket: Union[str, None] = None
+        self.cadence: Union[int, None] = None
 
     @abstractmethod
     def phrase_to_date(self) -> str:
@@ -39,9 +98,21 @@ class DatePhraseHandler(ABC):
 class BaseDateInterval(ABC):
     """Get Start of the Date Range"""
 
+    __slots__ = ("_time_bucket", "_cadence")
+
     def __init__(self, time_bucket: str, cadence: int):
-        self.time_bucket = time_bucket
-        self.cadence = cadence
+        self._time_bucket = time_bucket
+        self._cadence = cadence
+
+    @property
+    def time_bucket(self) -> str:
+        """Time bucket of the handler, read-only since handlers are shared"""
+        return self._time_bucket
+
+    @property
+    def cadence(self) -> int:
+        """Cadence of the handler, read-only since handlers are shared"""
+        return self._cadence
 
     @abstractmethod
     def get_start_date(self, start_date: datetime) -> datetime:
@@ -90,100 +161,196 @@ class BaseDateInterval(ABC):
         """
         raise NotImplementedError
 
+    def get_step(self) -> Union[timedelta, _MonthStep, _IntervalStep]:
+        """Builds the offset that moves a date forward by one interval of self.cadence
+
+        Subclasses that do not override it step with add_interval.
+
+        Returns:
+            Union[timedelta, _MonthStep, _IntervalStep]: offset to add to a date to get the next one
+        """
+        return _IntervalStep(self)
+
 
 class YearInterval(BaseDateInterval):
     """Class ti Get Yearly Cadence Start Date"""
 
-    def __init__(self, time_bucket: str, cadence: int):
-        super().__init__(time_bucket=time_bucket, cadence=cadence)
+    __slots__ = ()
 
     def get_start_date(self, start_date: datetime) -> datetime:
         """Handles Yearly Buckets"""
-        if self.time_bucket in ["yearly", "last_year", "this_year"]:
+        if self.time_bucket in {"yearly", "last_year", "this_year"}:
             start_date = start_date.replace(month=1, day=1)
         return start_date
 
     def add_interval(self, date_value: datetime, cadence: int):
         """Return a date that's `years` years after the date (or datetime)
         object `date_value`. Return the same calendar date (month and day) in the
-        destination year, if it exists, otherwise use the following day
-        (thus changing February 29 to March 1).
+        destination year, if it exists, otherwise use the last day of the month
+        (thus changing February 29 to February 28).
 
         """
-        next_date = date_value + relativedelta(years=cadence)
+        next_date = _add_months(date_value, 12 * cadence)
         return next_date
 
     def subtract_interval(self, date_value: datetime, cadence: int):
-        next_date = date_value - relativedelta(years=cadence)
+        next_date = _add_months(date_value, -12 * cadence)
         return next_date
 
+    def get_step(self) -> _MonthStep:
+        return _MonthStep(months=12 * self.cadence)
+
 
 class MonthInterval(BaseDateInterval):
     """Gets the Monthly Cadence Start Date"""
 
-    def __init__(self, time_bucket: str, cadence: int):
-        super().__init__(time_bucket=time_bucket, cadence=cadence)
+    __slots__ = ()
 
     def get_start_date(self, start_date: datetime) -> datetime:
         """Handles Monthly Buckets"""
-        if self.time_bucket in ["monthly", "month", "last_month", "this_month"]:
+        if self.time_bucket in {"monthly", "month", "last_month", "this_month"}:
             start_date = start_date.replace(day=1)
         return start_date
 
     def add_interval(self, date_value: datetime, cadence: int):
-        next_date = date_value + relativedelta(months=cadence)
+        next_date = _add_months(date_value, cadence)
         return next_date
 
     def subtract_interval(self, date_value: datetime, cadence: int):
-        next_date = date_value - relativedelta(months=cadence)
+        next_date = _add_months(date_value, -cadence)
         return next_date
 
+    def get_step(self) -> _MonthStep:
+        return _MonthStep(months=self.cadence)
+
 
 class WeekInterval(BaseDateInterval):
     """Get the Weekly Cadence Start Date"""
 
-    def __init__(self, time_bucket: str, cadence: int):
-        super().__init__(time_bucket=time_bucket, cadence=cadence)
+    __slots__ = ()
 
     def get_start_date(self, start_date: datetime) -> datetime:
         """Handles Weekly Buckets"""
-        if self.time_bucket in ["weekly", "last_week", "this_week"]:
-            if datetime.strftime(start_date, "%A") == "Sunday":
+        if self.time_bucket in {"weekly", "last_week", "this_week"}:
+            weekday = start_date.weekday()
+            if weekday == 6:
                 return start_date
-            start_date = start_date - timedelta(days=start_date.weekday() + 1)
+            start_date = start_date - timedelta(days=weekday + 1)
         return start_date
 
     def add_interval(self, date_value: datetime, cadence: int):
-        next_date = date_value + relativedelta(weeks=cadence)
+        next_date = date_value + timedelta(weeks=cadence)
         return next_date
 
     def subtract_interval(self, date_value: datetime, cadence: int):
-        next_date = date_value - relativedelta(weeks=cadence)
+        next_date = date_value - timedelta(weeks=cadence)
         return next_date
 
+    def get_step(self) -> timedelta:
+        return timedelta(weeks=self.cadence)
+
 
 class DayInterval(BaseDateInterval):
     """Get the Daily Cadence Start Date"""
 
-    def __init__(self, time_bucket: str, cadence: int):
-        super().__init__(time_bucket=time_bucket, cadence=cadence)
+    __slots__ = ()
 
     def get_start_date(self, start_date: datetime) -> datetime:
         """Handles Daily Buckets"""
         return start_date
 
     def add_interval(self, date_value: datetime, cadence: int):
-        next_date = date_value + relativedelta(days=cadence)
+        next_date = date_value + timedelta(days=cadence)
         return next_date
 
     def subtract_interval(self, date_value: datetime, cadence: int):
-        next_date = date_value - relativedelta(days=cadence)
+        next_date = date_value - timedelta(days=cadence)
         return next_date
 
+    def get_step(self) -> timedelta:
+        return timedelta(days=self.cadence)
+
+
+@lru_cache(maxsize=256)
+def _parse_past_phrase(date_value: str) -> Tuple[int, str]:
+    """Parses a past date phrase, cached since the result only depends on the string
+
+    Args:
+        date_value (str): string representing date e.g yesterday, 2_weeks_ago
+    Raises:
+        TypeError: if the date value does not contain any letters
+        DateValueError: if passed a wrong and unexpected date value
+        CadenceTimeBucketError: if cadence or time_bucket cannot be determined
+    Returns:
+        Tuple[int, str]: cadence and bucket(day, week, month, year)
+    """
+    if _ASCII_LETTERS.isdisjoint(date_value.lower()):
+        raise TypeError(
+            f"wrong date_string provided, expecting a string but got: {date_value}"
+        )
+    date_value = date_value.lower().strip()
+    cadence = _PHRASE_CADENCES.get(date_value)
+    if cadence is not None:
+        return cadence, date_value
+
+    parts = date_value.split("_")
+    if len(parts) == 1:
+        raise CadenceTimeBucketError(
+            f"cadence or time_bucket is None, wrong date_string provided '{date_value}'"
+        )
+    if len(parts) != 3 or parts[2] != "ago":
+        raise DateValueError(f"wrong date value provided {date_value}")
+    cadence, time_bucket = parts[0], parts[1]
+    if time_bucket[-1:] == "s":
+        time_bucket = time_bucket[:-1]
+
+    return int(cadence), time_bucket.strip()
+
+
+@lru_cache(maxsize=256)
+def _parse_interval(date_value: str) -> Tuple[int, str]:
+    """Parses an interval string, cached since the result only depends on the string
+
+    Args:
+        date_value (str): interval string e.g monthly, 1_day, 2_week
+    Raises:
+        TypeError: if the interval value provided does not contain any letters
+        TimeIntervalError: if the interval can be split more than 2 times
+        CadenceTimeBucketError: if the interval is not '<cadence>_<bucket>' or a known word
+        CadenceError: if the cadence of the interval is less than 1
+    Returns:
+        Tuple[int, str]: cadence that is an int and time_bucket
+    """
+    if _ASCII_LETTERS.isdisjoint(date_value.lower()):
+        raise TypeError(
+            f"wrong interval provided, expecting a string but got: {date_value}"
+        )
+
+    date_value = date_value.lower().strip()
+    if date_value in {"day", "yearly", "weekly", "monthly"}:
+        return 1, date_value
+
+    match = _INTERVAL_RE.match(date_value)
+    if match is not None:
+        cadence = int(match.group(1))
+        if cadence < 1:
+            raise CadenceError(
+                f"cadence must be at least 1, wrong interval '{date_value}'"
+            )
+        return cadence, match.group(2)
+
+    if len(date_value.replace(" ", "_").split("_")) > 2:
+        raise TimeIntervalError(f"invalid value for interval provided: {date_value}")
+    raise CadenceTimeBucketError(
+        f"cadence or time_bucket is None, wrong interval provided '{date_value}'"
+    )
+
 
 class PastDatePhraseHandler(DatePhraseHandler):
     """Handles Past Date Phrases"""
 
+    __slots__ = ()
+
     def phrase_to_date(self) -> Tuple[int, str]:
         """Processes the date value to return self.cadence and bucket
 
@@ -194,40 +361,19 @@ class PastDatePhraseHandler(DatePhraseHandler):
         Returns:
             Tuple[int, str]: self.cadence and bucket(day, week, month, year)
         """
-        pattern = re.compile(r"[a-z]+")
-        if not isinstance(self.date_value, str) or not pattern.search(
-            self.date_value.strip().lower()
-        ):
+        if not isinstance(self.date_value, str):
             raise TypeError(
                 f"wrong date_string provided, expecting a string but got: {self.date_value}"
             )
-        date_value = self.date_value.lower().strip()
-        if date_value in ["yesterday", "last_week", "last_month", "last_year"]:
-            self.cadence, self.time_bucket = 1, date_value
-        if date_value in ["today", "this_week", "this_year", "this_month"]:
-            self.cadence, self.time_bucket = 0, date_value
-
-        if re.search(r"\_", date_value) and self.time_bucket is None:
-            if len(date_value.split("_")) != 3 or date_value.split("_")[2] != "ago":
-                raise DateValueError(f"wrong date value provided {date_value}")
-            if len(date_value.split("_")) == 3:
-                self.cadence, self.time_bucket = date_value.split("_")[:-1]
-                if self.time_bucket.endswith("s"):
-                    self.time_bucket = self.time_bucket.replace("s", "")
-
-        if self.cadence is None or self.time_bucket is None:
-            raise CadenceTimeBucketError(
-                f"cadence or time_bucket is None, wrong date_string provided '{date_value}'"
-            )
-        # print(self.cadence, self.time_bucket)
-
-        self.cadence, self.time_bucket = int(self.cadence), self.time_bucket.strip()
+        self.cadence, self.time_bucket = _parse_past_phrase(self.date_value)
         return self.cadence, self.time_bucket
 
 
 class IntervalDatePhraseHandler(DatePhraseHandler):
     """Class for handling interval date string"""
 
+    __slots__ = ()
+
     def phrase_to_date(self) -> Tuple[int, str]:
         """Processes the interval variable to get the cadence and the time_bucket
         Raises:
@@ -237,33 +383,47 @@ class IntervalDatePhraseHandler(DatePhraseHandler):
         Returns:
             Tuple[int, str]: cadence that is an int and time_bucket
         """
-
-        if not isinstance(self.date_value, str) or not re.search(
-            r"[a-z]+", str(self.date_value).lower()
-        ):
+        if not isinstance(self.date_value, str):
             raise TypeError(
                 f"wrong interval provided, expecting a string but got: {self.date_value}"
             )
+        self.cadence, self.time_bucket = _parse_interval(self.date_value)
+        return self.cadence, self.time_bucket
 
-        date_value = self.date_value.lower().strip()
-        if date_value in ["day", "yearly", "weekly", "monthly"]:
-            self.cadence, self.time_bucket = 1, date_value
 
-        if len(date_value.split("_")) > 2 and self.time_bucket is None:
-            raise TimeIntervalError(
-                f"invalid value for interval provided: {date_value}"
-            )
+_BUCKET_TO_HANDLER = MappingProxyType(
+    {
+        time_bucket: handler_class
+        for handler_class, time_buckets in (
+            (DayInterval, ("day", "yesterday", "today")),
+            (WeekInterval, ("week", "weekly", "last_week", "this_week")),
+            (MonthInterval, ("month", "monthly", "last_month", "this_month")),
+            (YearInterval, ("year", "yearly", "last_year", "this_year")),
+        )
+        for time_bucket in time_buckets
+    }
+)
 
-        if len(self.date_value.replace(" ", "_").split("_")) == 2:
-            self.cadence, self.time_bucket = date_value.split("_")
 
-        if self.cadence is None or self.time_bucket is None:
-            raise CadenceTimeBucketError(
-                f"cadence or time_bucket is None, wrong interval provided '{date_value}'"
-            )
-        # print(self.cadence, self.time_bucket)
-        self.cadence, self.time_bucket = int(self.cadence), self.time_bucket.strip()
-        return self.cadence, self.time_bucket
+@lru_cache(maxsize=128)
+def get_date_handler(time_bucket: str, cadence: int) -> BaseDateInterval:
+    """Returns the interval handler for the time bucket, shared between calls
+
+    Handlers only hold a read-only time_bucket and cadence, so one instance per
+    (time_bucket, cadence) is cached and reused.
+
+    Args:
+        time_bucket (str): either day, week, month, year
+        cadence (int): cadence to be used to subtract or add date
+    Raises:
+        TimeBucketError: If the time bucket provided is not catered for
+    Returns:
+        BaseDateInterval: Returns and instance of BaseDateInterval
+    """
+    handler_class = _BUCKET_TO_HANDLER.get(time_bucket)
+    if handler_class is None:
+        raise TimeBucketError(f"wrong time bucket in the provided: '{time_bucket}'")
+    return handler_class(time_bucket=time_bucket, cadence=cadence)
 
 
 class DateHandlerFactory:
@@ -280,54 +440,249 @@ class DateHandlerFactory:
         Returns:
             BaseDateInterval: Returns and instance of BaseDateInterval
         """
+        return get_date_handler(time_bucket=time_bucket, cadence=cadence)
 
-        root_bucket = None
-        time_bucket_mapping = {
-            "day": ["day", "yesterday", "today"],
-            "week": ["week", "weekly", "last_week", "this_week"],
-            "month": ["month", "monthly", "last_month", "this_month"],
-            "year": ["year", "yearly", "last_year", "this_year"],
-        }
-
-        for key, val in time_bucket_mapping.items():
-            if time_bucket in val:
-                root_bucket = key
-
-        if root_bucket is None:
-            raise TimeBucketError(f"wrong time bucket in the provided: '{time_bucket}'")
-
-        date_handlers = {
-            "day": DayInterval,
-            "week": WeekInterval,
-            "month": MonthInterval,
-            "year": YearInterval,
-        }
-        return date_handlers[root_bucket](time_bucket=time_bucket, cadence=cadence)
 
+def _parse_iso_date(date_string: str) -> Union[datetime, None]:
+    """Parses a 'YYYY-MM-DD' string with datetime.fromisoformat instead of strptime
 
-def date_string_handler(date_string: str) -> datetime:
+    Args:
+        date_string (str): stripped date string e.g '2022-11-14'
+    Raises:
+        ValueError: if the string has the right shape but is not a valid date
+    Returns:
+        Union[datetime, None]: the parsed date or None if it is not an ASCII ISO date string
+    """
+    if len(date_string) != 10 or date_string[4] != "-" or date_string[7] != "-":
+        return None
+    if not date_string.isascii():
+        return None
+    if not (
+        date_string[0:4].isdigit()
+        and date_string[5:7].isdigit()
+        and date_string[8:10].isdigit()
+    ):
+        return None
+    return datetime.fromisoformat(date_string)
+
+
+def date_string_handler(
+    date_string: str, now: Union[datetime, None] = None
+) -> datetime:
     """Processes the Date and Returns the date value to work with
 
     Args:
         date_string (str): used to determine the date '2022-11-14', 2_days_ago, yeaterday, today
+        now (Union[datetime, None], optional): current time phrases are relative to.
+            Defaults to None which reads the clock.
 
     Returns:
         datetime: datetime value
     """
-    if re.search(r"\d{4}\-\d{2}\-\d{2}", str(date_string).strip()):
-        return datetime.strptime(str(date_string).strip(), "%Y-%m-%d")
+    date_value = _parse_iso_date(str(date_string).strip())
+    if date_value is not None:
+        return date_value
     phrase_handler = PastDatePhraseHandler(date_value=date_string)
     cadence, time_bucket = phrase_handler.phrase_to_date()
-    handler = DateHandlerFactory().get_date_handler(
-        time_bucket=time_bucket, cadence=cadence
-    )
-    start_date = datetime.now()
+    handler = get_date_handler(time_bucket=time_bucket, cadence=cadence)
+    start_date = datetime.now() if now is None else now
     start_date = handler.get_start_date(start_date=start_date)
+    if not cadence:
+        # today and this_* phrases, nothing to subtract
+        return start_date
 
     date_value = handler.subtract_interval(date_value=start_date, cadence=cadence)
     return date_value
 
 
+def batch_date_string_handler(date_strings: Iterable[str]) -> List[datetime]:
+    """Processes several date strings against a single reading of the clock
+
+    Args:
+        date_strings (Iterable[str]): date strings accepted by date_string_handler
+
+    Returns:
+        List[datetime]: datetime value for each date string, in order
+    """
+    now = datetime.now()
+    return [date_string_handler(date_string, now=now) for date_string in date_strings]
+
+
+def _date_formatter(
+    time_format: Union[str, None],
+) -> Tuple[Callable[[Union[date, datetime]], str], bool]:
+    """Picks the function used to format the dates yielded by the iterators
+
+    Args:
+        time_format (Union[str, None]): python date format, None means '%Y-%m-%d'
+    Returns:
+        Tuple[Callable[[Union[date, datetime]], str], bool]: function turning a date into
+            a string and whether it only shows the calendar date, so the iterators can
+            step over date values instead of datetimes
+    """
+    if time_format in (None, "%Y-%m-%d"):
+        # date.isoformat also gives 'YYYY-MM-DD' when called on a datetime
+        return date.isoformat, True
+    return lambda date_value: datetime.strftime(date_value, time_format), False
+
+
+def _format_boundaries(
+    boundaries: Iterator[Union[date, datetime]],
+    end_inclusive: bool,
+    date_format: Callable[[Union[date, datetime]], Union[str, datetime]],
+) -> Generator[Tuple[Union[str, datetime], Union[str, datetime]], None, None]:
+    """Pairs up consecutive interval boundaries, formatting every boundary only once
+
+    Args:
+        boundaries (Iterator[Union[date, datetime]]): start of every interval followed by
+            the last end
+        end_inclusive (bool): whether the yielded end for each interval is inclusive or not.
+        date_format (Callable[[Union[date, datetime]], Union[str, datetime]]): function used
+            to format the dates, the raw iterator passes one returning the datetime unchanged
+
+    Yields:
+        Generator[Tuple[Union[str, datetime], Union[str, datetime]], None, None]: start and
+            end for each time interval.
+    """
+    label = None
+    for boundary in boundaries:
+        boundary_label = date_format(boundary)
+        if label is not None:
+            if end_inclusive:
+                yield label, date_format(boundary - _ONE_DAY)
+            else:
+                yield label, boundary_label
+        label = boundary_label
+
+
+def _fixed_step_boundaries(
+    start_date: datetime,
+    end_date: datetime,
+    first_boundary: Union[date, datetime],
+    step: timedelta,
+) -> Iterator[Union[date, datetime]]:
+    """Builds the boundaries for fixed length (day/week) steps from a count
+
+    The number of intervals is known up front, so the boundaries are produced
+    from a count instead of comparing datetimes on every step.
+
+    Args:
+        start_date (datetime): start of the first interval
+        end_date (datetime): last date an interval may start on
+        first_boundary (Union[date, datetime]): start_date, or its date when only the
+            calendar date is formatted
+        step (timedelta): length of one interval, a whole number of days
+
+    Returns:
+        Iterator[Union[date, datetime]]: start of every interval followed by the last end
+    """
+    if start_date > end_date:
+        return iter(())
+    periods = (end_date - start_date) // step + 1
+    return accumulate(repeat(step, periods), initial=first_boundary)
+
+
+def _month_step_boundaries(
+    start_date: datetime,
+    end_date: datetime,
+    first_boundary: Union[date, datetime],
+    months: int,
+) -> Iterator[Union[date, datetime]]:
+    """Builds the boundaries for month/year steps using integer month indexes
+
+    Only valid when start_date.day <= 28, every boundary then keeps the day of
+    start_date and no end of month clamping can happen.
+
+    Args:
+        start_date (datetime): start of the first interval
+        end_date (datetime): last date an interval may start on
+        first_boundary (Union[date, datetime]): start_date, or its date when only the
+            calendar date is formatted
+        months (int): length of one interval in months
+
+    Returns:
+        Iterator[Union[date, datetime]]: start of every interval followed by the last end
+    """
+    start_index = start_date.year * 12 + start_date.month - 1
+    end_index = end_date.year * 12 + end_date.month - 1
+    periods = (end_index - start_index) // months + 1
+    if periods > 0 and _add_months(start_date, (periods - 1) * months) > end_date:
+        periods -= 1
+    if periods <= 0:
+        return iter(())
+    return (
+        first_boundary.replace(year=index // 12, month=index % 12 + 1)
+        for index in range(start_index, start_index + (periods + 1) * months, months)
+    )
+
+
+def _resolve_date_range(
+    start_date: str, end_date: str, interval: str
+) -> Tuple[BaseDateInterval, datetime, datetime]:
+    """Parses the range inputs into the interval handler and the first and last dates
+
+    Args:
+        start_date (str): date string (2022-11-14 or the allowed date string values)
+        end_date (str): date string (2022-11-14 or the allowed date string values)
+        interval (str): string 1_month, 1_day, yearly, monthly, weekly
+    Returns:
+        Tuple[BaseDateInterval, datetime, datetime]: handler, aligned start date and end date
+    """
+    phrase_handler = IntervalDatePhraseHandler(date_value=interval)
+    cadence, time_bucket = phrase_handler.phrase_to_date()
+    handler = get_date_handler(time_bucket=time_bucket, cadence=cadence)
+    now = datetime.now()
+    startdate = date_string_handler(start_date, now=now)
+    enddate = date_string_handler(end_date, now=now)
+    return handler, handler.get_start_date(start_date=startdate), enddate
+
+
+def _step_boundaries(
+    start_date: datetime,
+    end_date: datetime,
+    step: Union[timedelta, _MonthStep, _IntervalStep],
+) -> Generator[datetime, None, None]:
+    """Yields the start of every interval up to end_date followed by the end of the last one
+
+    Args:
+        start_date (datetime): start of the first interval
+        end_date (datetime): last date an interval may start on
+        step (Union[timedelta, _MonthStep, _IntervalStep]): offset of one interval
+
+    Yields:
+        Generator[datetime, None, None]: interval boundaries in order
+    """
+    while start_date <= end_date:
+        yield start_date
+        start_date = start_date + step
+    yield start_date
+
+
+def date_range_iterator_raw(
+    start_date: str,
+    end_date: str,
+    interval: str,
+    end_inclusive: bool = False,
+) -> Generator[Tuple[datetime, datetime], None, None]:
+    """Same ranges as date_range_iterator but yields datetime values without formatting them
+
+    Args:
+        start_date (str): date string (2022-11-14 or the allowed date string values)
+        end_date (str): date string (2022-11-14 or the allowed date string values)
+        interval (str): string 1_month, 1_day, yearly, monthly, weekly
+        end_inclusive (bool): whether the yielded end for period/interval is inclusive or not.
+
+    Yields:
+        Generator[Tuple[datetime, datetime], None, None]: start and end for each time interval.
+    """
+    handler, startdate, enddate = _resolve_date_range(start_date, end_date, interval)
+    yield from _format_boundaries(
+        _step_boundaries(startdate, enddate, handler.get_step()),
+        end_inclusive,
+        lambda date_value: date_value,
+    )
+
+
 def date_range_iterator(
     start_date: str,
     end_date: str,
@@ -347,22 +702,17 @@ def date_range_iterator(
     Yields:
         Generator[Tuple[str, str], None, None]: start and end (exclusive) for each time interval.
     """
-    phrase_handler = IntervalDatePhraseHandler(date_value=interval)
-    cadence, time_bucket = phrase_handler.phrase_to_date()
-    handler = DateHandlerFactory().get_date_handler(
-        time_bucket=time_bucket, cadence=cadence
-    )
-    startdate = date_string_handler(start_date)
-    enddate = date_string_handler(end_date)
-
-    startdate = handler.get_start_date(start_date=startdate)
-    next_end = handler.add_interval(date_value=startdate, cadence=cadence)
-    while startdate <= enddate:
-        end = next_end
-        if end_inclusive:
-            end = next_end - timedelta(days=1)
-        yield datetime.strftime(startdate, time_format), datetime.strftime(
-            end, time_format
+    handler, startdate, enddate = _resolve_date_range(start_date, end_date, interval)
+    date_format, date_only = _date_formatter(time_format)
+    # the fast paths step over date values when only the calendar date is shown
+    first_boundary = startdate.date() if date_only else startdate
+    step = handler.get_step()
+    if isinstance(step, timedelta):
+        boundaries = _fixed_step_boundaries(startdate, enddate, first_boundary, step)
+    elif isinstance(step, _MonthStep) and startdate.day <= 28:
+        boundaries = _month_step_boundaries(
+            startdate, enddate, first_boundary, step.months
         )
-        startdate = next_end
-        next_end = handler.add_interval(date_value=startdate, cadence=cadence)
+    else:
+        boundaries = _step_boundaries(startdate, enddate, step)
+    yield from _format_boundaries(boundaries, end_inclusive, date_format)
@@ -0,0 +1,8 @@
+"""PYTEST CONFIGURATION SHARED BY THE TEST MODULES"""
+
+import os
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
@@ -1,18 +1,16 @@
 """TEST READERS"""
-# pylint: disable=protected-access, wrong-import-position, import-error, unused-argument
+# pylint: disable=protected-access, import-error, unused-argument
 
-import os
-import sys
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
+from types import MappingProxyType
 
 import pytest
 
 
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.append(os.path.dirname(SCRIPT_DIR))
 # from base_test import BaseTest
 from exceptions import (
+    CadenceError,
     TimeIntervalError,
     TimeBucketError,
     CadenceTimeBucketError,
@@ -20,6 +18,7 @@ from exceptions import (
 )
 
 from date_managers import (
+    BaseDateInterval,
     DayInterval,
     MonthInterval,
     YearInterval,
@@ -27,42 +26,64 @@ from date_managers import (
     PastDatePhraseHandler,
     IntervalDatePhraseHandler,
     DateHandlerFactory,
+    get_date_handler,
     date_string_handler,
+    batch_date_string_handler,
     date_range_iterator,
+    date_range_iterator_raw,
 )
 
+_TIME_BUCKET_MAPPING = MappingProxyType(
+    {
+        "day": ("day", "yesterday", "today"),
+        "week": ("week", "weekly", "last_week", "this_week"),
+        "month": ("month", "monthly", "last_month", "this_month"),
+        "year": ("year", "yearly", "last_year", "this_year"),
+    }
+)
+
+_DATE_HANDLER_CLASSES = MappingProxyType(
+    {
+        "day": DayInterval,
+        "week": WeekInterval,
+        "month": MonthInterval,
+        "year": YearInterval,
+    }
+)
+
+_strptime = datetime.strptime
+_now = datetime.now
+
+_FACTORY = DateHandlerFactory()
+
+_START_DATE, _END_DATE = "2022-11-14", "2022-11-15"
+
+
+class FortnightInterval(BaseDateInterval):
+    """User defined interval that does not implement get_step"""
+
+    __slots__ = ()
+
+    def get_start_date(self, start_date: datetime) -> datetime:
+        return start_date
+
+    def add_interval(self, date_value: datetime, cadence: int) -> datetime:
+        return date_value + timedelta(weeks=2 * cadence)
+
+    def subtract_interval(self, date_value: datetime, cadence: int) -> datetime:
+        return date_value - timedelta(weeks=2 * cadence)
+
+
+@lru_cache(maxsize=None)
+def _cached_strptime(date_string: str, time_format: str = "%Y-%m-%d") -> datetime:
+    """Parse an expected date once, the tests reuse the same few literals"""
+    return _strptime(date_string, time_format)
+
 
 # @pytest.mark.usefixtures("environ_fixture")
 class TestDateManagers:
     """Class for Date Handler Classes and Methods"""
 
-    def time_bucket_mapping(self) -> dict:
-        """map interval with base bucket
-
-        Args:
-            interval (str): interval provided to be used
-
-        Returns:
-            dict:
-        """
-        time_bucket_mapping = {
-            "day": ["day", "yesterday", "today"],
-            "week": ["week", "weekly", "last_week", "this_week"],
-            "month": ["month", "monthly", "last_month", "this_month"],
-            "year": ["year", "yearly", "last_year", "this_year"],
-        }
-
-        return time_bucket_mapping
-
-    def date_handler_classes(self):
-        """Fixture for date handlers"""
-        return {
-            "day": DayInterval,
-            "week": WeekInterval,
-            "month": MonthInterval,
-            "year": YearInterval,
-        }
-
     # def test_base_classes(self):
     #     """Test Base Classes"""
     #     with pytest.raises(NotImplementedError):
@@ -90,17 +111,19 @@ class TestDateManagers:
         assert handler.cadence == 2
         assert handler.time_bucket == "year"
 
-        handler = PastDatePhraseHandler("1")
-        with pytest.raises(TypeError):
-            handler.phrase_to_date()
-
-        handler = PastDatePhraseHandler("2_years_before")
-        with pytest.raises(DateValueError):
-            handler.phrase_to_date()
-
-        handler = PastDatePhraseHandler("daily")
-        with pytest.raises(CadenceTimeBucketError):
-            handler.phrase_to_date()
+    @pytest.mark.parametrize(
+        "phrase, exception, match",
+        [
+            ("1", TypeError, "expecting a string"),
+            (["yesterday"], TypeError, "expecting a string"),
+            ("2_years_before", DateValueError, None),
+            ("daily", CadenceTimeBucketError, None),
+        ],
+    )
+    def test_past_date_phrase_handler_errors(self, phrase, exception, match):
+        """Test PastDatePhraseHandler rejects invalid phrases"""
+        with pytest.raises(exception, match=match):
+            PastDatePhraseHandler(phrase).phrase_to_date()
 
     def test_interval_date_phrase_handler(self):
         """Test the class PastDatePhraseHandler"""
@@ -114,197 +137,428 @@ class TestDateManagers:
         assert handler.cadence == 1
         assert handler.time_bucket == "monthly"
 
-        handler = IntervalDatePhraseHandler("1")
-        with pytest.raises(TypeError):
-            handler.phrase_to_date()
-
-        handler = IntervalDatePhraseHandler("2_month_before")
-        with pytest.raises(TimeIntervalError):
-            handler.phrase_to_date()
-
-        handler = IntervalDatePhraseHandler("quarterly")
-        with pytest.raises(CadenceTimeBucketError):
-            handler.phrase_to_date()
-
-    def test_data_handler_factory(self):
+    @pytest.mark.parametrize(
+        "phrase, exception, match",
+        [
+            ("1", TypeError, "expecting a string"),
+            (["1_day"], TypeError, "expecting a string"),
+            ("2_month_before", TimeIntervalError, None),
+            ("quarterly", CadenceTimeBucketError, None),
+        ],
+    )
+    def test_interval_date_phrase_handler_errors(self, phrase, exception, match):
+        """Test IntervalDatePhraseHandler rejects invalid intervals"""
+        with pytest.raises(exception, match=match):
+            IntervalDatePhraseHandler(phrase).phrase_to_date()
+
+    @pytest.mark.parametrize(
+        "time_bucket, expected_class",
+        [
+            (time_bucket, _DATE_HANDLER_CLASSES[key])
+            for key, time_buckets in _TIME_BUCKET_MAPPING.items()
+            for time_bucket in time_buckets
+        ],
+    )
+    def test_data_handler_factory(self, time_bucket, expected_class):
         """Test dat_handler_factory"""
-        time_bucket_mapping = self.time_bucket_mapping()
-        for key, val in time_bucket_mapping.items():
-            for time_bucket in val:
-                handler = DateHandlerFactory()
-                date_handler = handler.get_date_handler(
-                    time_bucket=time_bucket, cadence=1
-                )
-                if key == "day":
-                    assert isinstance(date_handler, DayInterval)
-                if key == "week":
-                    assert isinstance(date_handler, WeekInterval)
-                if key == "month":
-                    assert isinstance(date_handler, MonthInterval)
-                if key == "year":
-                    assert isinstance(date_handler, YearInterval)
-
-        wrong_time_buckets = ["annually", "quarterly", "daily", "termly", "biannually"]
-        for time_bucket in wrong_time_buckets:
-            with pytest.raises(TimeBucketError):
-                handler = DateHandlerFactory()
-                date_handler = handler.get_date_handler(
-                    time_bucket="annually", cadence=1
-                )
+        date_handler = _FACTORY.get_date_handler(time_bucket=time_bucket, cadence=1)
+        assert isinstance(date_handler, expected_class)
+
+    def test_data_handler_factory_read_only(self):
+        """Test the shared handlers returned by the factory cannot be changed"""
+        date_handler = _FACTORY.get_date_handler(time_bucket="day", cadence=1)
+        with pytest.raises(AttributeError):
+            date_handler.cadence = 7
+        with pytest.raises(AttributeError):
+            date_handler.time_bucket = "week"
+        assert _FACTORY.get_date_handler(time_bucket="day", cadence=1).cadence == 1
+
+    @pytest.mark.parametrize(
+        "time_bucket", ["annually", "quarterly", "daily", "termly", "biannually"]
+    )
+    def test_data_handler_factory_wrong_bucket(self, time_bucket):
+        """Test dat_handler_factory rejects unknown time buckets"""
+        with pytest.raises(TimeBucketError):
+            _FACTORY.get_date_handler(time_bucket=time_bucket, cadence=1)
+
+    @pytest.mark.parametrize(
+        "interval, cadence, time_bucket, handler_class",
+        [
+            ("day", 1, "day", DayInterval),
+            ("2_day", 2, "day", DayInterval),
+            ("Weekly", 1, "weekly", WeekInterval),
+            ("2_week", 2, "week", WeekInterval),
+            ("monthly", 1, "monthly", MonthInterval),
+            ("3_month", 3, "month", MonthInterval),
+            ("yearly", 1, "yearly", YearInterval),
+            ("1_year", 1, "year", YearInterval),
+        ],
+    )
+    def test_interval_date_handler(self, interval, cadence, time_bucket, handler_class):
+        """Test an interval string resolves to a cached date handler"""
+        parsed = IntervalDatePhraseHandler(interval).phrase_to_date()
+        assert parsed == (cadence, time_bucket)
+
+        handler = get_date_handler(time_bucket=time_bucket, cadence=cadence)
+        assert isinstance(handler, handler_class)
+        assert (handler.cadence, handler.time_bucket) == parsed
+        assert get_date_handler(time_bucket=time_bucket, cadence=cadence) is handler
 
     def test_date_string_handler(self):
         """Test sate_string_handler method"""
 
-        assert date_string_handler("2022-11-14") == datetime.strptime(
-            "2022-11-14", "%Y-%m-%d"
-        )
+        assert date_string_handler("2022-11-14") == _cached_strptime("2022-11-14")
 
-        assert datetime.strftime(
-            date_string_handler("today"), "%Y-%m-%d"
-        ) == datetime.strftime(datetime.now(), "%Y-%m-%d")
-
-        yesterday_date = datetime.now() - timedelta(days=1)
-        assert datetime.strftime(
-            date_string_handler("yesterday"), "%Y-%m-%d"
-        ) == datetime.strftime(yesterday_date, "%Y-%m-%d")
+        now = _now()
+        yesterday = now - timedelta(days=1)
+        assert date_string_handler("today", now=now).date() == now.date()
+        assert date_string_handler("yesterday", now=now).date() == yesterday.date()
+        # without now the handler reads the clock, which may have passed midnight
+        assert date_string_handler("today").date() in {now.date(), _now().date()}
 
         with pytest.raises(TypeError):
             date_string_handler("2022/11/14")
+        with pytest.raises(TypeError):
+            date_string_handler("\u0662\u0660\u0662\u0662-11-14")
         with pytest.raises(DateValueError):
             date_string_handler("1_Week")
 
-    def test_date_range_iterator_end_inclusive_true(self):
-        """Test date_range_iterator"""
-        start_date, end_date = "2022-11-14", "2022-11-15"
-        date_iterator = date_range_iterator(
-            start_date, end_date, "1_day", end_inclusive=True
+    def test_date_string_handler_now(self):
+        """Test date_string_handler phrases relative to a provided now"""
+        now = datetime(2022, 11, 23, 10, 30)
+        assert date_string_handler("today", now=now) == now
+        assert date_string_handler("yesterday", now=now) == datetime(
+            2022, 11, 22, 10, 30
+        )
+        assert date_string_handler("this_month", now=now) == datetime(
+            2022, 11, 1, 10, 30
+        )
+        assert date_string_handler("2022-11-14", now=now) == _cached_strptime(
+            "2022-11-14"
         )
-        assert next(date_iterator) == ("2022-11-14", "2022-11-14")
-        assert next(date_iterator) == ("2022-11-15", "2022-11-15")
-        with pytest.raises(StopIteration):
-            next(date_iterator)
 
-    def test_date_range_iterator_end_inclusive_false(self):
+    def test_batch_date_string_handler(self):
+        """Test batch_date_string_handler shares one now between phrases"""
+        today, yesterday, iso_date = batch_date_string_handler(
+            ["today", "yesterday", "2022-11-14"]
+        )
+        assert today - yesterday == timedelta(days=1)
+        assert iso_date == _cached_strptime("2022-11-14")
+
+    @pytest.mark.parametrize(
+        "end_inclusive, time_format, expected",
+        [
+            (
+                True,
+                "%Y-%m-%d",
+                [("2022-11-14", "2022-11-14"), ("2022-11-15", "2022-11-15")],
+            ),
+            (
+                False,
+                "%Y-%m-%d",
+                [("2022-11-14", "2022-11-15"), ("2022-11-15", "2022-11-16")],
+            ),
+            (
+                False,
+                "%d/%m/%Y",
+                [("14/11/2022", "15/11/2022"), ("15/11/2022", "16/11/2022")],
+            ),
+        ],
+    )
+    def test_date_range_iterator(self, end_inclusive, time_format, expected):
         """Test date_range_iterator"""
-        start_date, end_date = "2022-11-14", "2022-11-15"
         date_iterator = date_range_iterator(
-            start_date, end_date, "1_day", end_inclusive=False
+            _START_DATE,
+            _END_DATE,
+            "1_day",
+            end_inclusive=end_inclusive,
+            time_format=time_format,
         )
-        assert next(date_iterator) == ("2022-11-14", "2022-11-15")
-        assert next(date_iterator) == ("2022-11-15", "2022-11-16")
+        for date_pair in expected:
+            assert next(date_iterator) == date_pair
         with pytest.raises(StopIteration):
             next(date_iterator)
 
-    def test_date_range_iterator_time_format(self):
-        """Test date_range_iterator"""
-        start_date, end_date = "2022-11-14", "2022-11-15"
+    @pytest.mark.parametrize(
+        "date_range, interval, end_inclusive, time_format, expected",
+        [
+            (
+                ("2022-11-16", "2022-11-30"),
+                "weekly",
+                False,
+                "%Y-%m-%d",
+                [
+                    ("2022-11-13", "2022-11-20"),
+                    ("2022-11-20", "2022-11-27"),
+                    ("2022-11-27", "2022-12-04"),
+                ],
+            ),
+            (
+                ("2022-11-16", "2022-12-14"),
+                "2_week",
+                True,
+                "%Y-%m-%d",
+                [
+                    ("2022-11-16", "2022-11-29"),
+                    ("2022-11-30", "2022-12-13"),
+                    ("2022-12-14", "2022-12-27"),
+                ],
+            ),
+            (
+                ("2022-11-14", "2022-11-20"),
+                "3_day",
+                False,
+                "%d/%m/%Y",
+                [
+                    ("14/11/2022", "17/11/2022"),
+                    ("17/11/2022", "20/11/2022"),
+                    ("20/11/2022", "23/11/2022"),
+                ],
+            ),
+            (("2022-11-30", "2022-11-20"), "weekly", False, "%Y-%m-%d", []),
+            (("2022-11-20", "2022-11-14"), "3_day", True, "%Y-%m-%d", []),
+            (
+                ("2022-11-14", "2023-02-10"),
+                "monthly",
+                False,
+                "%Y-%m-%d",
+                [
+                    ("2022-11-01", "2022-12-01"),
+                    ("2022-12-01", "2023-01-01"),
+                    ("2023-01-01", "2023-02-01"),
+                    ("2023-02-01", "2023-03-01"),
+                ],
+            ),
+            (
+                ("2022-11-14", "2023-03-01"),
+                "2_month",
+                True,
+                "%Y-%m-%d",
+                [
+                    ("2022-11-01", "2022-12-31"),
+                    ("2023-01-01", "2023-02-28"),
+                    ("2023-03-01", "2023-04-30"),
+                ],
+            ),
+            (
+                ("2022-03-05", "2023-01-01"),
+                "yearly",
+                False,
+                "%d/%m/%Y",
+                [("01/01/2022", "01/01/2023"), ("01/01/2023", "01/01/2024")],
+            ),
+            (
+                ("2022-11-14", "2024-11-10"),
+                "1_year",
+                False,
+                "%Y-%m-%d",
+                [("2022-11-14", "2023-11-14"), ("2023-11-14", "2024-11-14")],
+            ),
+            (
+                ("2022-11-14", "2024-11-10"),
+                "1_year",
+                True,
+                "%d/%m/%Y",
+                [("14/11/2022", "13/11/2023"), ("14/11/2023", "13/11/2024")],
+            ),
+            (
+                ("2020-02-29", "2022-03-01"),
+                "1_year",
+                False,
+                "%Y-%m-%d",
+                [
+                    ("2020-02-29", "2021-02-28"),
+                    ("2021-02-28", "2022-02-28"),
+                    ("2022-02-28", "2023-02-28"),
+                ],
+            ),
+            (
+                ("2020-02-29", "2022-03-01"),
+                "1_year",
+                True,
+                "%d/%m/%Y",
+                [
+                    ("29/02/2020", "27/02/2021"),
+                    ("28/02/2021", "27/02/2022"),
+                    ("28/02/2022", "27/02/2023"),
+                ],
+            ),
+            (("2021-03-30", "2021-03-01"), "1_year", False, "%Y-%m-%d", []),
+            (("2022-12-14", "2022-10-01"), "monthly", False, "%Y-%m-%d", []),
+            (("2023-11-14", "2022-11-20"), "1_year", False, "%Y-%m-%d", []),
+        ],
+    )
+    def test_date_range_iterator_intervals(
+        self, date_range, interval, end_inclusive, time_format, expected
+    ):
+        """Test date_range_iterator with day, week, month and year intervals"""
         date_iterator = date_range_iterator(
-            start_date, end_date, "1_day", end_inclusive=False, time_format="%d/%m/%Y"
+            *date_range,
+            interval,
+            end_inclusive=end_inclusive,
+            time_format=time_format,
+        )
+        assert list(date_iterator) == expected
+
+    @pytest.mark.parametrize(
+        "start_date, interval",
+        [
+            ("2022-11-14", "0_day"),
+            ("2022-11-14", "0_week"),
+            ("2022-11-14", "0_month"),
+            ("2022-11-14", "0_year"),
+            ("2022-11-30", "0_year"),
+        ],
+    )
+    def test_date_range_iterator_zero_cadence(self, start_date, interval):
+        """Test the range iterators reject intervals with a zero cadence"""
+        with pytest.raises(CadenceError):
+            list(date_range_iterator(start_date, "2022-12-20", interval))
+        with pytest.raises(CadenceError):
+            list(date_range_iterator_raw(start_date, "2022-12-20", interval))
+
+    def test_date_range_iterator_raw(self):
+        """Test date_range_iterator_raw"""
+        start_date, end_date = "2022-11-14", "2022-12-15"
+        date_iterator = date_range_iterator_raw(
+            start_date, end_date, "monthly", end_inclusive=True
         )
-        assert next(date_iterator) == ("14/11/2022", "15/11/2022")
-        assert next(date_iterator) == ("15/11/2022", "16/11/2022")
+        assert next(date_iterator) == (datetime(2022, 11, 1), datetime(2022, 11, 30))
+        assert next(date_iterator) == (datetime(2022, 12, 1), datetime(2022, 12, 31))
         with pytest.raises(StopIteration):
             next(date_iterator)
 
     def test_date_string_handler_this_prefix(self):
         """Test this date phrases"""
-        current_date = datetime(2022, 11, 20)  # datetime.now()
+        current_date = _now()
         week_start = (current_date - timedelta(days=current_date.weekday() + 1)).date()
         month_start = current_date.replace(day=1).date()
         year_start = current_date.replace(month=1, day=1).date()
-        if datetime.strftime(current_date, "%A") == "Sunday":
+        if current_date.weekday() == 6:
             week_start = current_date.date()
 
-        assert date_string_handler("this_week").date() == week_start
-        assert date_string_handler("this_month").date() == month_start
-        assert date_string_handler("this_year").date() == year_start
+        assert date_string_handler("this_week", now=current_date).date() == week_start
+        assert date_string_handler("this_month", now=current_date).date() == month_start
+        assert date_string_handler("this_year", now=current_date).date() == year_start
 
     def test_date_string_handler_last_prefix(self):
         """Test last date phrases"""
-        current_date = datetime.now()
+        current_date = _now()
         last_week_start = (
             current_date - timedelta(days=current_date.weekday() + 1)
         ).date()
-        last_month_start = current_date.replace(day=1).date() - relativedelta(months=1)
-        last_year_start = current_date.replace(month=1, day=1).date() - relativedelta(
-            years=1
+        last_month_start = (
+            (current_date.replace(day=1) - timedelta(days=1)).replace(day=1).date()
         )
-        if datetime.strftime(current_date, "%A") == "Sunday":
+        last_year_start = current_date.replace(
+            year=current_date.year - 1, month=1, day=1
+        ).date()
+        if current_date.weekday() == 6:
             last_week_start = current_date.date()
-        last_week_start = last_week_start - relativedelta(weeks=1)
-
-        assert date_string_handler("last_week").date() == last_week_start
-        assert date_string_handler("last_month").date() == last_month_start
-        assert date_string_handler("last_year").date() == last_year_start
-
-    def test_week_add_interval(self):
-        """Test WeekInterval get_start_date method"""
-        date_val = datetime(2022, 11, 21)
-        expected_value = datetime(2022, 11, 20).date()
-        week_start = WeekInterval(time_bucket="weekly", cadence=1).get_start_date(
-            start_date=date_val
-        )
-        assert week_start.date() == expected_value
-        week_start = WeekInterval(time_bucket="this_week", cadence=1).get_start_date(
-            start_date=date_val
-        )
-        assert week_start.date() == expected_value
-        week_start = WeekInterval(time_bucket="last_week", cadence=1).get_start_date(
-            start_date=date_val
-        )
-        assert week_start.date() == expected_value
-        week_start = WeekInterval(time_bucket="weekly", cadence=1).get_start_date(
-            start_date=datetime(2022, 11, 20)
+        last_week_start = last_week_start - timedelta(weeks=1)
+
+        assert (
+            date_string_handler("last_week", now=current_date).date() == last_week_start
         )
-        assert week_start.date() == expected_value
-
-    def test_month_add_interval(self):
-        """Test MonthInterval get_start_date method"""
-        date_val = datetime(2022, 11, 21)
-        expected_value = datetime(2022, 11, 1).date()
-        period_start = MonthInterval(time_bucket="monthly", cadence=1).get_start_date(
-            start_date=date_val
+        assert (
+            date_string_handler("last_month", now=current_date).date()
+            == last_month_start
         )
-        assert period_start.date() == expected_value
-        period_start = MonthInterval(time_bucket="month", cadence=1).get_start_date(
-            start_date=date_val
+        assert (
+            date_string_handler("last_year", now=current_date).date() == last_year_start
         )
-        assert period_start.date() == expected_value
-        period_start = MonthInterval(
-            time_bucket="last_month", cadence=1
-        ).get_start_date(start_date=date_val)
-        assert period_start.date() == expected_value
-        period_start = MonthInterval(
-            time_bucket="this_month", cadence=1
-        ).get_start_date(start_date=date_val)
-        assert period_start.date() == expected_value
-
-    def test_week_interval_date_operation(self):
-        """test week interval date operations"""
-        date_value = datetime(2022, 11, 20)
-        interval_handler = WeekInterval(time_bucket="weekly", cadence=1)
-        _add = interval_handler.add_interval(date_value=date_value, cadence=1)
-        _subtract = interval_handler.subtract_interval(date_value=date_value, cadence=1)
 
-        assert _add == datetime(2022, 11, 27)
-        assert _subtract == datetime(2022, 11, 13)
-
-    def test_month_interval_date_operation(self):
-        """test month interval date operations"""
-        date_value = datetime(2022, 11, 20)
-        interval_handler = MonthInterval(time_bucket="monthly", cadence=1)
-        _add = interval_handler.add_interval(date_value=date_value, cadence=1)
-        _subtract = interval_handler.subtract_interval(date_value=date_value, cadence=1)
-
-        assert _add == datetime(2022, 12, 20)
-        assert _subtract == datetime(2022, 10, 20)
-
-    def test_year_interval_date_operation(self):
-        """test year interval date operations"""
-        date_value = datetime(2022, 11, 20)
-        interval_handler = YearInterval(time_bucket="year", cadence=1)
+    @pytest.mark.parametrize(
+        "handler_class, time_bucket, date_value, expected",
+        [
+            (WeekInterval, "weekly", datetime(2022, 11, 21), datetime(2022, 11, 20)),
+            (WeekInterval, "this_week", datetime(2022, 11, 21), datetime(2022, 11, 20)),
+            (WeekInterval, "last_week", datetime(2022, 11, 21), datetime(2022, 11, 20)),
+            (WeekInterval, "weekly", datetime(2022, 11, 20), datetime(2022, 11, 20)),
+            (MonthInterval, "monthly", datetime(2022, 11, 21), datetime(2022, 11, 1)),
+            (MonthInterval, "month", datetime(2022, 11, 21), datetime(2022, 11, 1)),
+            (
+                MonthInterval,
+                "last_month",
+                datetime(2022, 11, 21),
+                datetime(2022, 11, 1),
+            ),
+            (
+                MonthInterval,
+                "this_month",
+                datetime(2022, 11, 21),
+                datetime(2022, 11, 1),
+            ),
+        ],
+    )
+    def test_interval_get_start_date(
+        self, handler_class, time_bucket, date_value, expected
+    ):
+        """Test get_start_date of the interval classes"""
+        period_start = handler_class(time_bucket=time_bucket, cadence=1).get_start_date(
+            start_date=date_value
+        )
+        assert period_start.date() == expected.date()
+
+    def test_interval_default_step(self):
+        """Test subclasses without get_step step with add_interval"""
+        handler = FortnightInterval(time_bucket="fortnight", cadence=2)
+        assert datetime(2022, 11, 14) + handler.get_step() == datetime(2022, 12, 12)
+
+    @pytest.mark.parametrize(
+        "handler_class, time_bucket, date_value, expected_add, expected_subtract",
+        [
+            (
+                DayInterval,
+                "day",
+                datetime(2022, 11, 30),
+                datetime(2022, 12, 1),
+                datetime(2022, 11, 29),
+            ),
+            (
+                WeekInterval,
+                "weekly",
+                datetime(2022, 11, 20),
+                datetime(2022, 11, 27),
+                datetime(2022, 11, 13),
+            ),
+            (
+                MonthInterval,
+                "monthly",
+                datetime(2022, 11, 20),
+                datetime(2022, 12, 20),
+                datetime(2022, 10, 20),
+            ),
+            (
+                MonthInterval,
+                "monthly",
+                datetime(2023, 1, 31),
+                datetime(2023, 2, 28),
+                datetime(2022, 12, 31),
+            ),
+            (
+                YearInterval,
+                "year",
+                datetime(2022, 11, 20),
+                datetime(2023, 11, 20),
+                datetime(2021, 11, 20),
+            ),
+            (
+                YearInterval,
+                "year",
+                datetime(2024, 2, 29),
+                datetime(2025, 2, 28),
+                datetime(2023, 2, 28),
+            ),
+        ],
+    )
+    def test_interval_date_operation(
+        self, handler_class, time_bucket, date_value, expected_add, expected_subtract
+    ):
+        """test add_interval and subtract_interval of the interval classes"""
+        interval_handler = handler_class(time_bucket=time_bucket, cadence=1)
         _add = interval_handler.add_interval(date_value=date_value, cadence=1)
         _subtract = interval_handler.subtract_interval(date_value=date_value, cadence=1)
 
-        assert _add == datetime(2023, 11, 20)
-        assert _subtract == datetime(2021, 11, 20)
+        assert _add == expected_add
+        assert _subtract == expected_subtract